@@ -3,17 +3,17 @@
 # See the LICENSE file for details.
 from __future__ import annotations
 
-import dataclasses
 import itertools
 import re
 import struct
-from abc import ABC, abstractmethod
-from collections.abc import Mapping, MutableMapping, MutableSequence, Sequence
+import sys
+import weakref
+from collections.abc import Callable, Mapping, MutableMapping, MutableSequence, Sequence
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from enum import Enum
-from itertools import chain
-from typing import Annotated, Any, Iterable, Iterator, Type, get_args, get_origin
+from functools import lru_cache, wraps
+from typing import Annotated, Any, Iterable, Iterator, NamedTuple, Type, get_args, get_origin
 
 from typing_extensions import Self
 
@@ -51,24 +51,62 @@ class Params:
     alignment: int = 0
     byte_order: ByteOrder = field(default_factory=ByteOrder.get_default)
     packed: bool = False
+    # The struct format byte order char, read when building formats rather than the enum value.
+    byte_order_char: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "byte_order_char", self.byte_order.value)
 
     def create_context(self, **kwargs) -> Context:
         return Context(params=self, **kwargs)
 
 
-def lookup(obj: Any, attr: str | int, *attrs: str | int) -> Any:
-    if isinstance(obj, (Mapping, Sequence)):
-        obj = obj[attr]
-    elif isinstance(attr, str):
-        obj = getattr(obj, attr)
-    else:
-        raise ValueError(f"can not lookup {attr=} in {obj=}.")
-    if obj is MISSING:
-        raise KeyError(f"{attr=} is missing in {obj=}.")
-    if attrs:
-        return lookup(obj, *attrs)
-    else:
-        return obj
+# Common container types, checked for before falling back on the (slower) ABC instance checks.
+_MAPPING_OR_SEQUENCE_TYPES = frozenset((dict, list, tuple, str, bytes))
+_MUTABLE_MAPPING_OR_SEQUENCE_TYPES = frozenset((dict, list, bytearray))
+
+
+def lookup(obj: Any, *attrs: str | int) -> Any:
+    for attr in attrs:
+        if type(obj) in _MAPPING_OR_SEQUENCE_TYPES or isinstance(obj, (Mapping, Sequence)):
+            obj = obj[attr]
+        elif isinstance(attr, str):
+            obj = getattr(obj, attr)
+        else:
+            raise ValueError(f"can not lookup {attr=} in {obj=}.")
+        if obj is MISSING:
+            raise KeyError(f"{attr=} is missing in {obj=}.")
+    return obj
+
+
+@lru_cache(maxsize=1024)
+def _struct(fmt: str) -> struct.Struct:
+    """Compiled struct for `fmt`, to avoid parsing the same format string over and over."""
+    return struct.Struct(fmt)
+
+
+def cache_type_factory(func: Callable) -> Callable:
+    """Cache the types returned by a field type factory `__class_getitem__`.
+
+    The type is created anew for arguments that can not be cached, such as lists.
+    """
+    cached = lru_cache(maxsize=1024)(func)
+
+    @wraps(func)
+    def factory(cls, arg):
+        try:
+            hash(arg)
+        except TypeError:
+            return func(cls, arg)
+        return cached(cls, arg)
+
+    return factory
+
+
+@lru_cache(maxsize=4096)
+def _split_key(key: str) -> tuple[str, ...]:
+    """Split a dotted key into attribute names, once for each key."""
+    return tuple(key.split("."))
 
 
 def join_struct_formats(fmts: Iterable[str]) -> str:
@@ -87,10 +125,9 @@ def join_struct_formats(fmts: Iterable[str]) -> str:
     return "".join(f if n == 1 else f"{n}{f}" for n, f in acc)
 
 
-@dataclass
+@dataclass(slots=True)
 class Context:
-    @dataclass(frozen=True)
-    class FieldContext:
+    class FieldContext(NamedTuple):
         field: Field
         struct_format: str
         scope: tuple[str, ...]
@@ -102,20 +139,49 @@ class Context:
     offset: int = field(init=False, default=0)
     _scope: tuple[str, ...] = field(init=False, default=())
     _packed: bool | None = field(init=False, default=None)
+    _cached_fmt: str | None = field(init=False, default=None, repr=False)
+    _cached_size: int = field(init=False, default=0, repr=False)
+    _fields_size: int = field(init=False, default=0, repr=False)
+    _align_next: int = field(init=False, default=1, repr=False)
 
     @classmethod
     def from_obj(cls, obj) -> Context:
-        if params := getattr(obj, "__structclass_params__", None):
-            return params.create_context(root=obj)
-        else:
-            return Context(root=obj)
+        params = getattr(obj, "__structclass_params__", None) or Params()
+        return Context._create(params, obj)
+
+    @staticmethod
+    def _create(params: Params, root: Any, data: bytes = b"") -> Context:
+        """Create new context, without the overhead of going through `__init__`."""
+        c = Context.__new__(Context)
+        c.params = params
+        c.root = root
+        c.data = data
+        c.fields = []
+        c.offset = 0
+        c._scope = ()
+        c._packed = None
+        c._cached_fmt = None
+        c._cached_size = 0
+        c._fields_size = 0
+        c._align_next = 1
+        return c
 
     def new(self, **kwargs) -> Context:
         """Create new context, using the same params."""
         return self.params.create_context(**kwargs)
 
-    def __post_init__(self) -> None:
-        self._align_next = 1
+    def clone(
+        self, *, params: Params | None = None, root: Any = MISSING, data: bytes | None = None
+    ) -> Context:
+        """Create new context with the same params, root and data unless overridden.
+
+        Like `dataclasses.replace`, only without having to go through `__init__`.
+        """
+        return Context._create(
+            self.params if params is None else params,
+            self.root if root is MISSING else root,
+            self.data if data is None else data,
+        )
 
     @property
     def packed(self) -> bool:
@@ -128,22 +194,27 @@ class Context:
     def packed(self, value: bool) -> None:
         self._packed = value
 
+    def push_scope(self, *scope: str, packed: bool | None = None) -> tuple:
+        """Enter `scope`, returning the state to pass to `pop_scope` once done."""
+        state = (self._scope, self._packed)
+        scope = tuple(s for s in scope if s is not None)
+        if scope:
+            if packed is not None:
+                self._packed = packed
+            self._scope = (*self._scope, *scope)
+        return state
+
+    def pop_scope(self, state: tuple) -> None:
+        """Leave scope entered with `push_scope`."""
+        self._scope, self._packed = state
+
     @contextmanager
     def scope(self, *scope: str, packed: bool | None = None) -> None:
-        scope = [s for s in scope if s is not None]
-        if not scope:
-            yield
-            return
-
-        restore_packed = self._packed
-        if packed is not None:
-            self._packed = packed
+        state = self.push_scope(*scope, packed=packed)
         try:
-            self._scope = (*self._scope, *scope)
             yield
         finally:
-            self._scope = self._scope[: -len(scope)]
-            self._packed = restore_packed
+            self.pop_scope(state)
 
     @contextmanager
     def reset_scope(self, *scope: str, packed: bool | None = None) -> None:
@@ -158,24 +229,53 @@ class Context:
             self._scope = restore_to
             self._packed = restore_packed
 
+    def _fields_format(self) -> tuple[str, int]:
+        """Struct format and size for the current fields, without any trailing alignment."""
+        if self._cached_fmt is None:
+            fields_fmt = join_struct_formats(fx.struct_format for fx in self.fields)
+            self._cached_fmt = f"{self.params.byte_order_char}{fields_fmt}"
+            self._cached_size = _struct(self._cached_fmt).size
+        return self._cached_fmt, self._cached_size
+
     @property
     def struct_format(self) -> str:
-        fields_fmt = join_struct_formats(fx.struct_format for fx in self.fields)
-        fmt = f"{self.params.byte_order.value}{fields_fmt}"
-        if self._align_next > 1 and (pad := struct.calcsize(fmt) % self._align_next) > 0:
+        fmt, size = self._fields_format()
+        # Alignment is relative to the start of the data, also when unpacking from an offset.
+        if self._align_next > 1 and (pad := (self.offset + size) % self._align_next) > 0:
             fmt = f"{fmt}{self._align_next - pad}x"
         return fmt
 
+    def _get_fields_size(self) -> int:
+        """Size of the current fields, without any trailing alignment."""
+        if self.params.byte_order_char == "@":
+            # Native alignment depends on the preceding fields, so size the whole format.
+            return self._fields_format()[1]
+        # Without native alignment, the size is the sum of the size of each field, as added.
+        return self._fields_size
+
+    def _clear_fields(self) -> None:
+        self.fields = []
+        self._cached_fmt = None
+        self._fields_size = 0
+
     @property
     def size(self) -> int:
-        return len(self.data) + struct.calcsize(self.struct_format)
+        size = self._get_fields_size()
+        if self._align_next > 1 and (pad := (self.offset + size) % self._align_next) > 0:
+            size += self._align_next - pad
+        return len(self.data) + size
+
+    def get_offset(self) -> int:
+        """Offset for the next field, not including any pending alignment."""
+        return self.offset + self._get_fields_size()
 
     def get_padding(self, alignment: int) -> str:
         alignment = max(alignment, self._align_next)
         self._align_next = 1
         if alignment <= 1 or self.packed:
             return ""
-        offset = self.offset + struct.calcsize(self.struct_format)
+        # The trailing alignment is reset above, so this is the offset following `struct_format`.
+        offset = self.get_offset()
         pad = offset % alignment
         if pad == 0:
             return ""
@@ -188,62 +288,118 @@ class Context:
         assert alignment >= 1 and alignment <= 8
         self._align_next = alignment
 
-    def add(self, field: Field, **kwargs) -> None:
-        if "struct_format" not in kwargs:
-            fmt = field.struct_format(self)
-        else:
-            fmt = kwargs.pop("struct_format")
-        kwargs["scope"] = (*self._scope, *kwargs.get("scope", ()))
-        padding = self.get_padding(kwargs.pop("align", field.align))
-        self.fields.append(Context.FieldContext(field, struct_format=f"{padding}{fmt}", **kwargs))
-
-    def pack(self) -> bytes:
+    def add(
+        self,
+        field: Field,
+        struct_format: str | None = None,
+        scope: tuple[str, ...] = (),
+        align: int | None = None,
+    ) -> None:
+        if struct_format is None:
+            struct_format = field.struct_format(self)
+        # Scopes are immutable tuples, so no need to copy it (this is the empty tuple for top-level
+        # fields).
+        scope = (*self._scope, *scope) if scope else self._scope
+        padding = self.get_padding(field.align if align is None else align)
+        fmt = f"{padding}{struct_format}"
+        self.fields.append(Context.FieldContext(field, fmt, scope))
+        self._cached_fmt = None
+        if fmt and self.params.byte_order_char != "@":
+            self._fields_size += _struct(f"{self.params.byte_order_char}{fmt}").size
+
+    def _pack_values(self) -> tuple[struct.Struct, list[PrimitiveType]]:
+        """Compiled struct and values to pack for the current fields."""
+        packer = _struct(self.struct_format)
+        values = []
+        extend = values.extend
+        with self.reset_scope():
+            for fx in self.fields:
+                # No need to restore the field scope, `reset_scope` takes care of that.
+                self._scope = fx.scope
+                if fx.field.name or fx.scope:
+                    value = self.get(fx.field.name)
+                else:
+                    value = self.root
+                extend(fx.field.pack_value(self, value))
+        return packer, values
+
+    def pack(self) -> bytes | bytearray:
         if self.fields:
-            with self.reset_scope():
-                values_it = chain.from_iterable(self._pack_field(fx) for fx in self.fields)
-                self.data += struct.pack(self.struct_format, *values_it)
-            self.fields = []
+            packer, values = self._pack_values()
+            if not self.data:
+                self.data = packer.pack(*values)
+            else:
+                # Append in place, rather than copying all previously packed data for each pack.
+                if not isinstance(self.data, bytearray):
+                    self.data = bytearray(self.data)
+                self.data += packer.pack(*values)
+            self._clear_fields()
         return self.data
 
-    def _pack_field(self, fx: FieldContext) -> Iterable[PrimitiveType]:
-        with self.scope(*fx.scope):
-            if fx.field.name or self._scope:
-                value = self.get(fx.field.name)
-            else:
-                value = self.root
-            return fx.field.pack_value(self, value)
+    def pack_into(self, buffer: bytearray | memoryview, offset: int = 0) -> int:
+        """Pack into `buffer` at `offset`, returning the offset just past the packed data.
+
+        Any previously packed data is written first. The current fields are packed directly into
+        `buffer`, without keeping a copy of the packed data in this context.
+        """
+        if self.data:
+            end = offset + len(self.data)
+            memoryview(buffer)[offset:end] = self.data
+            offset = end
+        if self.fields:
+            packer, values = self._pack_values()
+            packer.pack_into(buffer, offset, *values)
+            offset += packer.size
+            self._clear_fields()
+        return offset
 
     def unpack(self) -> Any:
         if self.fields:
             with self.reset_scope():
                 values_it = self.unpack_next(self.struct_format)
                 fields = self.fields
-                self.fields = []
+                self._clear_fields()
                 for fx in fields:
-                    with self.scope(*fx.scope):
-                        if (
-                            (value := fx.field.unpack_value(self, values_it)) is not None
-                            # and fx.field.name
-                            or self._scope
-                        ):
-                            self.set(fx.field.name, value, upsert=True)
+                    # No need to restore the field scope, `reset_scope` takes care of that.
+                    self._scope = fx.scope
+                    value = fx.field.unpack_value(self, values_it)
+                    name = fx.field.name
+                    if not fx.scope and type(self.root) is dict and name and "." not in name:
+                        # Plain top-level field, no need to go through `set` for this.
+                        if value is not None:
+                            self.root[name] = value
+                    elif value is not None or fx.scope:
+                        self.set(name, value, upsert=True)
         return self.root
 
     def unpack_next(self, fmt: str) -> Iterator[Any]:
         try:
-            values = struct.unpack_from(fmt, self.data, self.offset)
-            self.offset += struct.calcsize(fmt)
+            s = _struct(fmt)
+            values = s.unpack_from(self.data, self.offset)
+            self.offset += s.size
             return iter(values)
         except Exception as e:
-            raise type(e)(f"{e}\n{fmt=} {self.offset=} {self.data=}") from e
+            raise type(e)(f"{e}\n{fmt=} {self.offset=} self.data={bytes(self.data)!r}") from e
+
+    def unpack_bytes(self, length: int) -> bytes:
+        """Unpack the next `length` bytes as-is, without going through a struct format."""
+        end = self.offset + length
+        if end > len(self.data):
+            raise struct.error(
+                f"unpack requires {length} bytes at offset {self.offset}, data is {len(self.data)} bytes"
+            )
+        value = bytes(self.data[self.offset : end])
+        self.offset = end
+        return value
 
     def get(self, key: Any, default: Any = MISSING, set_default: bool | None = None) -> Any:
-        if isinstance(key, (tuple, list)):
+        # Plain string keys are by far the most common, so check for those first.
+        if isinstance(key, str):
+            attrs = _split_key(key)
+        elif isinstance(key, (tuple, list)):
             return tuple(self.get(k, default=default, set_default=set_default) for k in key)
-        if callable(key):
+        elif callable(key):
             return key()
-        if isinstance(key, str):
-            attrs = key.split(".")
         elif key is not None:
             attrs = (key,)
         else:
@@ -263,7 +419,11 @@ class Context:
             )
 
     def set(self, key: Any, value: Any, upsert: bool = False) -> None:
-        if isinstance(key, (tuple, list)):
+        scope = self._scope
+        # Plain string keys are by far the most common, so check for those first.
+        if isinstance(key, str):
+            attrs = _split_key(key)
+        elif isinstance(key, (tuple, list)):
             if isinstance(value, (tuple, list)):
                 assert len(value) == len(key)
             else:
@@ -271,12 +431,9 @@ class Context:
             for k, v in zip(key, value):
                 self.set(k, v, upsert=upsert)
             return
-        if callable(key):
+        elif callable(key):
             key(self, value)
             return
-        scope = self._scope
-        if isinstance(key, str):
-            attrs = key.split(".")
         elif key is not None:
             attrs = (key,)
         elif self._scope:
@@ -292,7 +449,10 @@ class Context:
         else:
             obj = self.root
         attr = attrs[-1]
-        if isinstance(obj, (MutableMapping, MutableSequence)) and (attr in obj or upsert):
+        if (
+            type(obj) in _MUTABLE_MAPPING_OR_SEQUENCE_TYPES
+            or isinstance(obj, (MutableMapping, MutableSequence))
+        ) and (upsert or attr in obj):
             if not upsert:
                 assert isinstance(value, type(obj[attr]))
             obj[attr] = value
@@ -310,7 +470,7 @@ class Context:
 PrimitiveType = Type[bytes | int | bool | float | str]
 
 
-class Field(ABC):
+class Field:
     align: int
     name: str | None
     type: type
@@ -321,7 +481,8 @@ class Field(ABC):
         self.type = field_type
         if "fmt" in kwargs:
             try:
-                self.fmt = kwargs["fmt"].format(**kwargs)
+                # The same few formats are used by many fields, so share a single copy of each.
+                self.fmt = sys.intern(kwargs["fmt"].format(**kwargs))
             except KeyError as e:
                 raise TypeError(f"structclasses: missing field type option: {e}") from e
         # May provide `fmt` as a property.
@@ -334,6 +495,20 @@ class Field(ABC):
     def struct_format(self, context: Context) -> str:
         return self.fmt
 
+    def is_static(self) -> bool:
+        """Whether the field value is packed as-is using `fmt`, regardless of context."""
+        return False
+
+    def static_converters(self) -> tuple[Callable | None, Callable | None] | None:
+        """Value conversions for fields packed as a single value using `fmt`, regardless of context.
+
+        Returns the functions converting the field value to and from the packed value, or `None` for
+        values packed as-is. Fields not packed this way return `None` rather than a pair.
+        """
+        if self.is_static():
+            return None, None
+        return None
+
     def configure(self, align: int | None = None, **kwargs) -> Field:
         """Field specific options.
 
@@ -345,6 +520,8 @@ class Field(ABC):
             class MyStruct:
                 foo: uint8
                 example: text[8] = field(pack_length="example", unpack_length="foo")
+
+        The options are applied when the structclass is decorated, and are fixed after that.
         """
         if align is not None:
             self.align = align
@@ -354,7 +531,7 @@ class Field(ABC):
     def size(self, context: Context | None = None) -> int:
         fmt = self.struct_format(context) if context is not None else self.fmt
         try:
-            return struct.calcsize(fmt)
+            return _struct(fmt).size
         except struct.error as e:
             raise TypeError(f"{self}: {fmt=}") from e
 
@@ -414,37 +591,65 @@ class Field(ABC):
         if field_type is None:
             field_type = cls
 
-        if (origin_type := get_origin(field_type)) is Annotated:
-            for meta in field_type.__metadata__:
-                if isinstance(meta, type) and issubclass(meta, Field):
-                    return meta(field_type.__origin__, **kwargs)
-            return cls._create_field(field_type.__origin__, **kwargs)
-
-        if origin_type is not None:
+        if get_origin(field_type) is Annotated:
+            try:
+                field_type, field_class = _unwrap_annotated(field_type)
+            except TypeError:
+                # Unhashable metadata, can not be cached.
+                field_type, field_class = _unwrap_annotated.__wrapped__(field_type)
+            if field_class is not None:
+                return field_class(field_type, **kwargs)
+
+        if get_origin(field_type) is not None:
             raise NotImplementedError(f"generic types not handled yet, got: {field_type}")
 
         # Try all Field subclasses if there's an implementation for this field type.
         if field_type != cls:
-            for sub in Field.__subclasses__():
+            try:
+                sub = Field.__field_type_classes__.get(field_type)
+            except TypeError:
+                # Field types that can not be weakly referenced are not remembered.
+                sub = None
+            if sub is not None:
                 try:
                     return sub._create(field_type, **kwargs)
                 except IncompatibleFieldTypeError:
                     pass
+            for sub in Field.__subclasses__():
+                try:
+                    fld = sub._create(field_type, **kwargs)
+                except IncompatibleFieldTypeError:
+                    continue
+                try:
+                    Field.__field_type_classes__[field_type] = sub
+                except TypeError:
+                    pass
+                return fld
 
         raise TypeError(f"structclasses: no field type implementation for {field_type=}")
 
+    # The Field subclass that last accepted each field type in `_create_field`. Weakly keyed, so
+    # that classes defined at runtime, such as structclasses and enums, may still be freed.
+    __field_type_classes__: weakref.WeakKeyDictionary[type, type[Field]] = (
+        weakref.WeakKeyDictionary()
+    )
+
     __specialized_classes__ = {}
+    # Number of unique names handed out so far, per requested class name.
+    __specialized_counters__: dict[str, int] = {}
 
     @classmethod
     def _create_specialized_class(
         cls, name: str, ns: Mapping[str, Any], unique: bool = False
     ) -> type:
         if unique:
-            unique_name = name
-            count = 1
-            while unique_name in Field.__specialized_classes__:
+            count = Field.__specialized_counters__.get(name, 0)
+            unique_name = None
+            # Resume from the last count, only probing again if some other name got in the way.
+            while unique_name is None or unique_name in Field.__specialized_classes__:
                 count += 1
-                unique_name = f"{name}_{count}"
+                unique_name = name if count == 1 else f"{name}_{count}"
+            Field.__specialized_counters__[name] = count
             name = unique_name
 
         if name not in Field.__specialized_classes__:
@@ -452,12 +657,23 @@ class Field(ABC):
         return Field.__specialized_classes__[name]
 
 
+@lru_cache(maxsize=512)
+def _unwrap_annotated(field_type: Any) -> tuple[Any, type[Field] | None]:
+    """Strip `Annotated` from `field_type`, along with the first `Field` class in its metadata."""
+    while get_origin(field_type) is Annotated:
+        for meta in field_type.__metadata__:
+            if isinstance(meta, type) and issubclass(meta, Field):
+                return field_type.__origin__, meta
+        field_type = field_type.__origin__
+    return field_type, None
+
+
 class NestedFieldMixin:
     def get_nested_context(self, context: Context, *fields: Field, **kwargs) -> Context:
-        c = dataclasses.replace(context, **kwargs)
+        c = context.clone(**kwargs)
         for fld in fields:
             fld.unpack(context)
         return c
 
     def get_nested_size(self, context: Context, *fields: Field) -> None:
-        return struct.calcsize(self.get_nested_context(context, *fields).struct_format)
+        return _struct(self.get_nested_context(context, *fields).struct_format).size
@@ -1,5 +1,108 @@
 # Copyright (c) 2025 Andreas Stenius
 # This software is licensed under the MIT License.
 # See the LICENSE file for details.
+import gc
+import struct
+import weakref
+from enum import IntEnum
+
+import pytest
+
+from structclasses import structclass, uint8
+from structclasses.base import ByteOrder, Context, Params
+from structclasses.field.primitive import PrimitiveField
+
+
 def test_dummy():
     pass
+
+
+def test_context_clone() -> None:
+    ctx = Context(Params(byte_order=ByteOrder.BIG_ENDIAN), root={"a": 1}, data=b"\0\0\0\1")
+    ctx.add(PrimitiveField(int, name="a"))
+
+    c = ctx.clone(root={})
+    assert c.params is ctx.params
+    assert c.data is ctx.data
+    assert {} == c.root
+    assert [] == c.fields
+    assert ">" == c.struct_format
+    assert {"a": 1} == ctx.clone().root
+
+
+def test_context_pack_appends_data() -> None:
+    ctx = Context(root={"a": 1, "b": 2})
+    ctx.add(PrimitiveField(int, name="a"))
+    assert b"\1\0\0\0" == ctx.pack()
+    ctx.add(PrimitiveField(int, name="b"))
+    assert b"\1\0\0\0\2\0\0\0" == ctx.pack()
+    assert isinstance(ctx.data, bytearray)
+
+
+def test_context_pack_into() -> None:
+    ctx = Context(root={"a": 1, "b": 2})
+    ctx.add(PrimitiveField(int, name="a"))
+    ctx.pack()
+    ctx.add(PrimitiveField(int, name="b"))
+    buffer = bytearray(10)
+    assert 9 == ctx.pack_into(buffer, 1)
+    assert b"\0\1\0\0\0\2\0\0\0\0" == buffer
+    assert b"\1\0\0\0" == ctx.data
+
+
+def test_context_unpack_bytes() -> None:
+    ctx = Context(data=memoryview(b"abcdef"))
+    ctx.offset = 1
+    assert b"bcd" == ctx.unpack_bytes(3)
+    assert 4 == ctx.offset
+    with pytest.raises(struct.error):
+        ctx.unpack_bytes(3)
+
+
+def test_context_push_pop_scope() -> None:
+    ctx = Context(root={"a": {"b": [1, 2]}})
+    outer = ctx.push_scope("a", None, packed=True)
+    assert ctx.packed
+    inner = ctx.push_scope("b", 1)
+    assert 2 == ctx.get(None)
+    ctx.pop_scope(inner)
+    assert [1, 2] == ctx.get("b")
+    ctx.pop_scope(outer)
+    assert not ctx.packed
+    assert ctx.root == ctx.get(None)
+
+
+def test_context_from_obj() -> None:
+    class Obj:
+        __structclass_params__ = Params(packed=True)
+
+    obj = Obj()
+    ctx = Context.from_obj(obj)
+    assert ctx.root is obj
+    assert ctx.packed
+    assert Context(root=obj, params=Obj.__structclass_params__) == ctx
+    assert Context(root={}) == Context.from_obj({})
+
+
+def test_params_byte_order_char() -> None:
+    assert Params(byte_order=ByteOrder.BIG_ENDIAN).byte_order_char == ">"
+    assert Params(byte_order=ByteOrder.LITTLE_ENDIAN) == Params(byte_order=ByteOrder.LITTLE_ENDIAN)
+
+
+def test_field_types_are_not_kept_alive() -> None:
+    class Color(IntEnum):
+        RED = 1
+
+    @structclass
+    class Item:
+        a: uint8
+
+    @structclass
+    class Items:
+        item: Item
+        color: Color
+
+    refs = weakref.ref(Item), weakref.ref(Color)
+    del Color, Item, Items
+    gc.collect()
+    assert (None, None) == tuple(ref() for ref in refs)
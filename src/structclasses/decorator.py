@@ -3,17 +3,22 @@
 # See the LICENSE file for details.
 import inspect
 import struct
+import sys
+from collections.abc import Callable
 from dataclasses import dataclass
 from dataclasses import fields as dataclass_fields
 from io import BufferedIOBase
 
 from typing_extensions import Self
 
-from structclasses.base import ByteOrder, Context, Field, Params
+from structclasses.base import ByteOrder, Context, Field, Params, _struct
 from structclasses.field.meta import get_field_metadata
 
 _FIELDS = "__structclass_fields__"
 _PARAMS = "__structclass_params__"
+_STRUCT = "__structclass_struct__"
+# The fields as returned by `fields`, created once rather than on each call.
+_FIELDS_TUPLE = "__structclass_fields_tuple__"
 
 
 def is_structclass(obj) -> bool:
@@ -23,12 +28,10 @@ def is_structclass(obj) -> bool:
 
 def fields(obj) -> tuple[Field, ...]:
     try:
-        fields = getattr(obj, _FIELDS)
+        return getattr(obj, _FIELDS_TUPLE)
     except AttributeError:
         raise TypeError("must be called with a structclass type or instance") from None
 
-    return tuple(fields.values())
-
 
 def params(obj) -> Params:
     try:
@@ -72,11 +75,22 @@ def _process_class(cls, alignment: int | None, byte_order: ByteOrder, packed: bo
                 align = field.align
 
     setattr(cls, _FIELDS, fields)
+    setattr(cls, _FIELDS_TUPLE, tuple(fields.values()))
     setattr(cls, _PARAMS, Params(align, byte_order, packed or False))
     setattr(cls, "_format", _format(cls=cls))
-    setattr(cls, "_pack", _pack)
-    setattr(cls, "_unpack", _unpack)
-    setattr(cls, "__len__", _len)
+    setattr(cls, _STRUCT, _static_struct(cls))
+    if getattr(cls, _STRUCT) is not None:
+        static_pack, static_pack_into, static_unpack = _static_methods(cls)
+        setattr(cls, "_format", _static_format(getattr(cls, _STRUCT).format))
+        setattr(cls, "_pack", static_pack)
+        setattr(cls, "_pack_into", static_pack_into)
+        setattr(cls, "_unpack", classmethod(static_unpack))
+        setattr(cls, "__len__", _static_len(getattr(cls, _STRUCT).size))
+    else:
+        setattr(cls, "_pack", _pack)
+        setattr(cls, "_pack_into", _pack_into)
+        setattr(cls, "_unpack", _unpack)
+        setattr(cls, "__len__", _len)
     setattr(cls, "__bool__", _bool)
     setattr(cls, "write", _write)
     setattr(cls, "read", _read)
@@ -91,34 +105,171 @@ def _bool(self) -> bool:
 
 
 def _format(cls):
+    # Without an instance, the format only depends on the class fields, so compute it once. The
+    # fields are configured while the class is decorated, and are not changed after that.
+    class_format = None
+
     def _do_format(self=None) -> str:
+        nonlocal class_format
+        fields = getattr(cls, _FIELDS).values()
         if self is not None:
-            meth = "pack"
-            obj = self
-        else:
-            meth = "unpack"
-            obj = {}
-        context = Context(getattr(cls, _PARAMS), obj)
-        for fld in getattr(cls, _FIELDS).values():
-            getattr(fld, meth)(context)
-        return context.struct_format
+            context = Context._create(getattr(cls, _PARAMS), self)
+            for fld in fields:
+                fld.pack(context)
+            return context.struct_format
+        if class_format is None:
+            context = Context._create(getattr(cls, _PARAMS), {})
+            for fld in fields:
+                fld.unpack(context)
+            class_format = context.struct_format
+        return class_format
 
     return _do_format
 
 
+def _static_format(fmt: str):
+    """Static classes have the same format regardless of the field values."""
+
+    def _do_format(self=None) -> str:
+        return fmt
+
+    return _do_format
+
+
+def _static_struct(cls) -> struct.Struct | None:
+    """Precompiled struct for classes with only static fields, as the format then never changes.
+
+    Fields packed as a single value with a static format, after converting the value, such as enums
+    and fixed length text, are considered static here. So are nested structclasses with only static
+    fields.
+
+    Packing may lay out nested structclasses differently than the class format, such as with the
+    padding following a packed structclass. Such classes are packed field by field, as before.
+    """
+    fields = getattr(cls, _FIELDS).values()
+    for fld in fields:
+        if fld.static_converters() is None and not (
+            is_structclass(fld.type) and getattr(fld.type, _STRUCT)
+        ):
+            return None
+    # Static fields do not look at the values when registered for packing.
+    context = Context._create(getattr(cls, _PARAMS), {})
+    for fld in fields:
+        fld.pack(context)
+    if context.struct_format != cls._format():
+        return None
+    return _struct(sys.intern(cls._format()))
+
+
+def _static_methods(cls) -> tuple[Callable, Callable, Callable]:
+    """Generate `_pack`, `_pack_into` and `_unpack` methods for a static structclass.
+
+    The generated methods use the precompiled struct directly, with the attribute access of all
+    fields, including those of nested structclasses, inlined in field order. Field values are only
+    passed through functions for fields that convert them.
+
+    Values packed as-is are checked to be of the field type, as the fields do themselves. Packing
+    values that fail this check, or that the struct or a converter rejects, falls back to the generic
+    pack, so invalid field values are reported the same as for any other structclass.
+    """
+    packer = getattr(cls, _STRUCT)
+    ns = {
+        "_struct_pack": packer.pack,
+        "_struct_pack_into": packer.pack_into,
+        "_struct_unpack_from": packer.unpack_from,
+        "_size": packer.size,
+        # Converters raise `TypeError` or `AttributeError` for values of the wrong type.
+        "_pack_errors": (struct.error, TypeError, AttributeError),
+        "_generic_pack": _pack,
+        "_generic_pack_into": _pack_into,
+        "_isinstance": isinstance,
+    }
+    attrs = []
+    values = []
+    checks = []
+
+    def flatten(obj: str, cls_name: str, cls: type) -> str:
+        kwargs = []
+        for name, fld in getattr(cls, _FIELDS).items():
+            if (converters := fld.static_converters()) is not None:
+                idx = len(attrs)
+                attr = value = f"v{idx}"
+                values.append(f"{obj}.{name}")
+                pack_value, unpack_value = converters
+                if pack_value is not None:
+                    ns[f"_pack{idx}"] = pack_value
+                    attr = f"_pack{idx}({attr})"
+                else:
+                    ns[f"_type{idx}"] = fld.type
+                    checks.append(f"_isinstance(v{idx}, _type{idx})")
+                if unpack_value is not None:
+                    ns[f"_unpack{idx}"] = unpack_value
+                    value = f"_unpack{idx}({value})"
+                kwargs.append(f"{name}={value}")
+                attrs.append(attr)
+            else:
+                nested_cls_name = f"_cls{len(ns)}"
+                ns[nested_cls_name] = fld.type
+                kwargs.append(f"{name}={flatten(f'{obj}.{name}', nested_cls_name, fld.type)}")
+        return f"{cls_name}({', '.join(kwargs)})"
+
+    create = flatten("self", "cls", cls)
+    # All values are read up front, so that values packed as-is may be checked before packing.
+    get_values = [f"        v{idx} = {value}" for idx, value in enumerate(values)]
+    valid = " and ".join(checks) or "True"
+    src = [
+        "def _pack(self):",
+        "    try:",
+        *get_values,
+        f"        if {valid}:",
+        f"            return _struct_pack({', '.join(attrs)})",
+        "    except _pack_errors:",
+        "        pass",
+        "    return _generic_pack(self)",
+        "def _pack_into(self, buffer, offset=0):",
+        "    try:",
+        *get_values,
+        f"        if {valid}:",
+        f"            _struct_pack_into(buffer, offset, {', '.join(attrs)})",
+        "            return offset + _size",
+        "    except _pack_errors:",
+        "        pass",
+        "    return _generic_pack_into(self, buffer, offset)",
+        "def _unpack(cls, data):",
+    ]
+    if attrs:
+        src.append(
+            f"    {', '.join(f'v{idx}' for idx in range(len(attrs)))}, = _struct_unpack_from(data)"
+        )
+    src.append(f"    return {create}")
+    exec("\n".join(src), ns)
+    for meth in ("_pack", "_pack_into", "_unpack"):
+        ns[meth].__qualname__ = f"{cls.__qualname__}.{meth}"
+    return ns["_pack"], ns["_pack_into"], ns["_unpack"]
+
+
 # Structclass method.
 def _pack(self) -> bytes:
-    context = Context(getattr(self, _PARAMS), self)
+    context = Context.from_obj(self)
+    for fld in getattr(self, _FIELDS).values():
+        fld.pack(context)
+    return bytes(context.pack())
+
+
+# Structclass method.
+def _pack_into(self, buffer: bytearray | memoryview, offset: int = 0) -> int:
+    """Pack into `buffer` at `offset`, returning the offset just past the packed data."""
+    context = Context.from_obj(self)
     for fld in getattr(self, _FIELDS).values():
         fld.pack(context)
-    data = context.pack()
-    return data
+    return context.pack_into(buffer, offset)
 
 
 # Structclass method.
 @classmethod
 def _unpack(cls: type[Self], data: bytes) -> Self:
-    context = Context(getattr(cls, _PARAMS), {}, data)
+    # Unpack from a read-only view of the data, so nested unpacking never copies it.
+    context = Context(getattr(cls, _PARAMS), {}, memoryview(data).toreadonly())
     for fld in getattr(cls, _FIELDS).values():
         fld.unpack(context)
     context.unpack()
@@ -127,7 +278,16 @@ def _unpack(cls: type[Self], data: bytes) -> Self:
 
 # Structclass method
 def _len(self) -> int:
-    return struct.calcsize(self._format())
+    return _struct(self._format()).size
+
+
+def _static_len(size: int):
+    """Static classes have the same size regardless of the field values."""
+
+    def __len__(self) -> int:
+        return size
+
+    return __len__
 
 
 # Structclass method
@@ -142,7 +302,8 @@ def _read(cls: type[Self], io: BufferedIOBase) -> Self:
 
 
 def _register_classlength(cls) -> type:
-    length = struct.calcsize(cls._format())
+    packer = getattr(cls, _STRUCT)
+    length = packer.size if packer is not None else _struct(cls._format()).size
     meta = type(cls)
 
     class StructclassType(meta):
@@ -4,6 +4,7 @@
 # from __future__ import annotations
 
 
+from enum import IntEnum
 from io import BytesIO
 
 import pytest
@@ -13,6 +14,7 @@ from structclasses import (
     ByteOrder,
     array,
     binary,
+    double,
     field,
     fields,
     int8,
@@ -295,7 +297,7 @@ def test_disjoint_dynamic_length_array() -> None:
 
     s = DisjointDataLength(HeaderStuff(2), [42, 24])
     assert "=B" == DisjointDataLength._format()
-    assert "=B3xii" == s._format()
+    assert "=B3x2i" == s._format()
     assert_roundtrip(s)
     assert len(s) == 12
 
@@ -318,7 +320,7 @@ def test_disjoint_dynamic_length_array() -> None:
 
 
 def _check_field(cls, name, length, pack_length, unpack_length):
-    fld = next(fld for fld in fields(cls) if fld.name == name)
+    fld = cls.__structclass_fields__[name]
     assert length == fld.length
     assert pack_length == fld.pack_length
     assert unpack_length == fld.unpack_length
@@ -386,3 +388,186 @@ def test_write_to_stream() -> None:
     assert b"\x44\x55" == io.getbuffer()
     io.seek(0)
     assert Data.read(io) == s
+
+
+def test_pack_into() -> None:
+    @structclass
+    class Static:
+        a: int8
+        b: int8
+
+    @structclass
+    class Dynamic:
+        count: uint8
+        xs: array[uint8, "count"]  # noqa: F821
+
+    buffer = bytearray(7)
+    offset = Static(0x44, 0x55)._pack_into(buffer)
+    assert 2 == offset
+    assert 7 == Dynamic(3, [1, 2, 3])._pack_into(buffer, offset + 1)
+    assert b"\x44\x55\0\x03\x01\x02\x03" == buffer
+
+
+def test_static_struct() -> None:
+    @structclass
+    class Static:
+        a: int8
+        b: int
+
+    @structclass
+    class Dynamic:
+        count: int
+        xs: array[int, "count"]  # noqa: F821
+
+    @structclass
+    class NestedStatic:
+        a: Static
+        b: uint8
+
+    @structclass
+    class NestedDynamic:
+        a: Static
+        b: Dynamic
+
+    assert "=b3xi" == Static.__structclass_struct__.format
+    assert "=b3xiB" == NestedStatic.__structclass_struct__.format
+    assert Dynamic.__structclass_struct__ is None
+    assert NestedDynamic.__structclass_struct__ is None
+
+    s = Static(1, 2)
+    assert b"\1\0\0\0\2\0\0\0" == s._pack()
+    assert_roundtrip(s)
+    assert_roundtrip(NestedStatic(s, 3))
+
+
+def test_static_struct_with_packed_nested_struct() -> None:
+    @structclass(packed=True)
+    class P:
+        a: int8
+        b: int
+
+    @structclass
+    class SEnd:
+        x: uint8
+        p: P
+
+    @structclass
+    class S:
+        x: uint8
+        p: P
+        y: uint8
+
+    @structclass
+    class D:
+        n: uint8
+        xs: array[uint8, "n"]  # noqa: F821
+        p: P
+        y: uint8
+
+    # The padding following the packed struct is only there when packing, so these are packed
+    # field by field.
+    assert SEnd.__structclass_struct__ is None
+    assert S.__structclass_struct__ is None
+    assert 8 == len(SEnd(1, P(2, 3))._pack())
+    assert_roundtrip(SEnd(1, P(2, 3)))
+    assert b"\1\2\3\0\0\0\0\0\4" == S(1, P(2, 3), 4)._pack()
+    assert b"\1\1\2\3\0\0\0\0\4" == D(1, [1], P(2, 3), 4)._pack()
+
+
+def test_static_struct_invalid_value() -> None:
+    @structclass
+    class Static:
+        a: int8
+        b: int
+
+    @structclass
+    class NestedStatic:
+        a: Static
+        b: uint8
+
+    with pytest.raises(AssertionError):
+        Static(1, 2.0)._pack()
+    with pytest.raises(AssertionError):
+        Static(1, 2.0)._pack_into(bytearray(8))
+    with pytest.raises(AssertionError):
+        NestedStatic(Static(1, 2), "3")._pack()
+
+    @structclass
+    class Typed:
+        a: double
+        b: bool
+
+    assert Typed.__structclass_struct__ is not None
+    with pytest.raises(AssertionError):
+        Typed(1, True)._pack()
+    with pytest.raises(AssertionError):
+        Typed(1.0, 1)._pack_into(bytearray(9))
+
+
+def test_static_struct_with_converted_values() -> None:
+    class Color(IntEnum):
+        RED = 1
+        BLUE = 2
+
+    class Other(IntEnum):
+        BLUE = 2
+
+    @structclass
+    class Converted:
+        color: Color
+        name: text[6]
+        data: binary[2]
+
+    @structclass
+    class Sized:
+        length: uint8
+        name: text[6] = field(pack_length="name", unpack_length="length")
+
+    assert "=i6s2s" == Converted.__structclass_struct__.format
+    assert Sized.__structclass_struct__ is None
+
+    c = Converted(Color.BLUE, "blue", b"\1\2")
+    assert b"\2\0\0\0blue\0\0\1\2" == c._pack()
+    assert_roundtrip(c)
+    assert Converted._unpack(c._pack()).color is Color.BLUE
+
+    with pytest.raises(AssertionError):
+        Converted(2, "blue", b"\1\2")._pack()
+    with pytest.raises(AssertionError):
+        Converted(Other.BLUE, "blue", b"\1\2")._pack()
+    with pytest.raises(AssertionError):
+        Converted(Color.BLUE, b"blue", b"\1\2")._pack()
+    with pytest.raises(AssertionError):
+        Converted(Color.BLUE, "blue", "ab")._pack_into(bytearray(12))
+
+
+def test_fields() -> None:
+    @structclass
+    class Base:
+        a: int8
+
+    @structclass
+    class Derived(Base):
+        b: uint8
+
+    assert ("a",) == tuple(fld.name for fld in fields(Base))
+    assert ("a", "b") == tuple(fld.name for fld in fields(Derived(1, 2)))
+    assert fields(Derived) is fields(Derived)
+    with pytest.raises(TypeError):
+        fields(object)
+
+
+def test_static_format_not_inherited() -> None:
+    @structclass
+    class Base:
+        count: uint8
+
+    @structclass
+    class Derived(Base):
+        xs: array[uint8, "count"]  # noqa: F821
+
+    assert "=B" == Base._format()
+    assert "=B" == Derived._format()
+    assert Derived._format() is Derived._format()
+    assert "=4B" == Derived(3, [1, 2, 3])._format()
+    assert_roundtrip(Derived(3, [1, 2, 3]))
@@ -3,12 +3,22 @@
 # See the LICENSE file for details.
 from __future__ import annotations
 
+from collections.abc import Mapping
 from contextlib import nullcontext
-
-# from collections.abc import Mapping
-from typing import Annotated, TypeVar
-
-from structclasses.base import MISSING, Context, Field
+from functools import lru_cache
+from itertools import chain, cycle, islice, repeat
+from operator import attrgetter, itemgetter
+from typing import Annotated, Any, Callable, Iterable, Iterator, TypeVar
+
+from structclasses.base import (
+    MISSING,
+    Context,
+    Field,
+    PrimitiveType,
+    cache_type_factory,
+    join_struct_formats,
+)
+from structclasses.field.record import RecordField
 
 
 class ArrayField(Field):
@@ -37,6 +47,24 @@ class ArrayField(Field):
         if length is not None:
             self.length = length
         assert isinstance(self.length, (int, str))
+        # Items that are packed as-is with a single format char may be packed all in one go.
+        self.bulk = self.elem_field.is_static() and len(self.elem_field.fmt) == 1
+        # Records with only static fields may also be packed all in one go, given a way to get all
+        # field values of each record.
+        self.static_records = isinstance(self.elem_field, RecordField) and all(
+            fld.is_static() for fld in self.elem_field.fields
+        )
+        self.get_record_values: Callable[[Any], Iterable[PrimitiveType]] | None = None
+        self._record_formats: dict[tuple[str, str, bool], tuple[tuple[str, ...], ...]] = {}
+        if self.static_records:
+            names = self.elem_field.names
+            # Mapping records are indexed by field name, others have the fields as attributes.
+            getter = itemgetter if issubclass(self.elem_field.type, Mapping) else attrgetter
+            if len(names) > 1:
+                self.get_record_values = getter(*names)
+            else:
+                get_value = getter(names[0])
+                self.get_record_values = lambda item: (get_value(item),)
         super().__init__(field_type, **kwargs)
 
     def configure(
@@ -60,6 +88,9 @@ class ArrayField(Field):
             # Unpack length is always correct at this point, also when packing.
             length = self.get_length(context, self.unpack_length)
             cm = context.scope(self.name)
+        if self.bulk or self.static_records:
+            # All items are of the same static size.
+            return length * self.elem_field.size(context) if length else 0
         with cm:
             size = 0
             for idx in range(length):
@@ -85,6 +116,17 @@ class ArrayField(Field):
         if isinstance(self.unpack_length, str):
             # Update unpack length field when packing.
             context.set(self.unpack_length, length)
+        if self.bulk:
+            if length:
+                context.add(self, struct_format=f"{length}{self.elem_field.fmt}")
+            return
+        if self.get_record_values is not None and self.elem_field.is_static_in(context):
+            if length:
+                context.align(self.elem_field.align)
+                context.add(self, struct_format=self.get_records_format(context, "pack", length))
+                # Align following the last record, the same as the record does itself.
+                context.align(self.elem_field.align)
+            return
         for idx in range(length):
             with context.scope(self.name, idx):
                 self.elem_field.pack(context)
@@ -99,6 +141,22 @@ class ArrayField(Field):
                 return
 
         length = self.get_length(context, self.unpack_length)
+        if self.bulk and length:
+            context.add(self, struct_format=f"{length}{self.elem_field.fmt}")
+            return
+
+        if (
+            self.static_records
+            and length
+            and context.data
+            and self.elem_field.is_static_in(context)
+        ):
+            # The unpacked records are created from the values of all records in one go.
+            context.align(self.elem_field.align)
+            # Each record includes the padding following it when unpacking, also the last one.
+            context.add(self, struct_format=self.get_records_format(context, "unpack", length))
+            return
+
         context.get(self.name, default=[MISSING] * length)
         if length == 0:
             return
@@ -120,11 +178,55 @@ class ArrayField(Field):
             with context.scope(self.name, idx):
                 self.elem_field.unpack(context)
 
+    def get_records_format(self, context: Context, meth: str, length: int) -> str:
+        """Struct format for `length` records, the same as when processing each record by itself."""
+        key = (meth, context.params.byte_order_char, context.packed)
+        if (record_format := self._record_formats.get(key)) is None:
+            # Process two records, as any padding between records goes with the second one. Records
+            # in arrays are aligned, so the format is the same for all records after the first one.
+            scratch = context.clone(root={}, data=b"")
+            scratch.packed = context.packed
+            getattr(self.elem_field, meth)(scratch)
+            first = tuple(fx.struct_format for fx in scratch.fields)
+            getattr(self.elem_field, meth)(scratch)
+            rest = tuple(fx.struct_format for fx in scratch.fields[len(first) :])
+            record_format = self._record_formats[key] = first, rest
+        return _repeat_formats(*record_format, length)
+
+    def pack_value(self, context: Context, value: Any) -> Iterable[PrimitiveType]:
+        """Return all items to pack, when packing in bulk."""
+        length = self.get_length(context, self.pack_length)
+        # Only copy the items when there are more of them than what is packed.
+        items = value if len(value) == length else value[:length]
+        if self.get_record_values is not None:
+            values = list(chain.from_iterable(map(self.get_record_values, items)))
+            # The same check as the record fields do for each value by itself.
+            assert all(map(isinstance, values, cycle(self.elem_field.types)))
+            return values
+        # The same check as the element field does for each item by itself.
+        assert all(map(isinstance, items, repeat(self.elem_field.type)))
+        return items
+
+    def unpack_value(self, context: Context, values: Iterator[PrimitiveType]) -> Any:
+        """Return list of all unpacked items, when unpacking in bulk."""
+        length = self.get_length(context, self.unpack_length)
+        if self.static_records:
+            return self.elem_field.unpack_batch(context, values, length)
+        return list(islice(values, length))
+
+
+@lru_cache(maxsize=256)
+def _repeat_formats(first: tuple[str, ...], rest: tuple[str, ...], count: int) -> str:
+    """Join `first` followed by `count - 1` repetitions of `rest`."""
+    return join_struct_formats(chain(first, chain.from_iterable(repeat(rest, count - 1))))
+
 
 T = TypeVar("T")
 
 
 class array:
+    @classmethod
+    @cache_type_factory
     def __class_getitem__(cls, arg: tuple[type[T], int]) -> list[T]:
         elem_type, length = arg
         return Annotated[list[elem_type], ArrayField[elem_type, length]]
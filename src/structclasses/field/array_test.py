@@ -3,7 +3,22 @@
 # See the LICENSE file for details.
 import pytest
 
-from structclasses import array, field, structclass, text, uint16, uint32, uint64
+from structclasses import (
+    ByteOrder,
+    array,
+    double,
+    field,
+    int8,
+    int16,
+    int32,
+    record,
+    structclass,
+    text,
+    uint8,
+    uint16,
+    uint32,
+    uint64,
+)
 
 
 @pytest.mark.parametrize(
@@ -18,6 +33,11 @@ def test_array_field_class_name(atype: type, field_type_name: str) -> None:
     assert field_type_name == field_type.__name__
 
 
+def test_array_type_is_reused() -> None:
+    assert array[uint16, 3] is array[uint16, 3]
+    assert array[uint16, 3] is not array[uint16, 4]
+
+
 def test_nested_struct() -> None:
     @structclass(packed=True)
     class Item:
@@ -77,3 +97,155 @@ def test_array_with_large_num_items_of_dynamic_size() -> None:
 
     assert "=I" == Item._format()
     assert "=" == List._format()  # The size of `items` is unknown without data.
+
+
+@pytest.mark.timeout(1)
+@pytest.mark.parametrize(
+    "elem_type, value",
+    [
+        (int32, list(range(-50_000, 50_000))),
+        (double, [i / 4 for i in range(100_000)]),
+    ],
+)
+def test_large_primitive_array(elem_type: type, value: list) -> None:
+    @structclass(byte_order=ByteOrder.BIG_ENDIAN)
+    class Frame:
+        count: uint32
+        samples: array[elem_type, 100_000] = field(pack_length="samples", unpack_length="count")
+
+    s = Frame(0, value)
+    data = s._pack()
+    assert 100_000 == s.count
+    assert s == Frame._unpack(data)
+
+
+def test_primitive_array_item_type() -> None:
+    @structclass
+    class Samples:
+        xs: array[double, 2]
+
+    with pytest.raises(AssertionError):
+        Samples([1, 2])._pack()
+    assert Samples([1.0, 2.0]) == Samples._unpack(Samples([1.0, 2.0])._pack())
+
+
+def test_static_record_array_value_types() -> None:
+    @structclass
+    class Item:
+        x: double
+        y: int8
+
+    @structclass
+    class Items:
+        n: uint8
+        xs: array[Item, "n"]  # noqa: F821
+
+    with pytest.raises(AssertionError):
+        Items(2, [Item(1.0, 2), Item(3, 4)])._pack()
+    s = Items(2, [Item(1.0, 2), Item(3.0, 4)])
+    assert s == Items._unpack(s._pack())
+
+
+def test_primitive_array_size() -> None:
+    fld = array[uint16, 3].__metadata__[0](list[int])
+    assert 6 == fld.size()
+
+
+@pytest.mark.parametrize(
+    "packed, fmt, data",
+    [
+        (
+            False,
+            "=B3xb3xib3xiB",
+            b"\x09\0\0\0\x01\0\0\0\x02\0\0\0\x03\0\0\0\x04\0\0\0\x05",
+        ),
+        (True, "=BbibiB", b"\x09\x01\x02\0\0\0\x03\x04\0\0\0\x05"),
+    ],
+)
+def test_static_record_array(packed: bool, fmt: str, data: bytes) -> None:
+    @structclass(packed=packed)
+    class Records:
+        head: uint8
+        xs: array[record[dict, ("a", int8), ("b", int32)], 2]  # noqa: F821
+        tail: uint8
+
+    s = Records(9, [dict(a=1, b=2), dict(a=3, b=4)], 5)
+    assert fmt == s._format()
+    assert data == s._pack()
+    assert s == Records._unpack(data)
+
+
+def test_static_record_array_size() -> None:
+    fld = array[record[dict, ("a", int8), ("b", int32)], 1000].__metadata__[0](list[dict])
+    assert 8000 == fld.size()
+
+
+def test_static_structclass_array() -> None:
+    @structclass
+    class Item:
+        a: int8
+        b: int32
+        c: int8
+
+    @structclass
+    class Items:
+        items: array[Item, 3]
+        tail: uint8
+
+    s = Items([Item(1, 2, 3), Item(4, 5, 6), Item(7, 8, 9)], 10)
+    data = s._pack()
+    assert 37 == len(data)
+    assert s == Items._unpack(data)
+
+
+def test_single_field_structclass_array() -> None:
+    @structclass
+    class Item:
+        a: uint16
+
+    @structclass
+    class Items:
+        count: uint8
+        items: array[Item, "count"]  # noqa: F821
+
+    s = Items(2, [Item(1), Item(2)])
+    assert b"\2\0\1\0\2\0" == s._pack()
+    assert s == Items._unpack(s._pack())
+
+
+def test_dynamic_structclass_array() -> None:
+    @structclass
+    class Item:
+        a: int8
+        b: int32
+        c: text[2]
+
+    @structclass
+    class Items:
+        items: array[Item, 50]
+
+    s = Items([Item(i, i, "ab") for i in range(50)])
+    data = s._pack()
+    assert 50 * 12 == len(data)
+    assert s == Items._unpack(data)
+
+
+def test_packed_structclass_array_before_packed_record() -> None:
+    @structclass(packed=True)
+    class Item:
+        a: int8
+        b: int32
+        c: int16
+
+    @structclass(packed=True)
+    class Tail:
+        n: uint8
+        xs: array[uint16, "n"]  # noqa: F821
+
+    @structclass
+    class Items:
+        items: array[Item, 2]
+        tail: Tail
+
+    s = Items([Item(1, 2, 3), Item(4, 5, 6)], Tail(2, [7, 8]))
+    assert s == Items._unpack(s._pack())
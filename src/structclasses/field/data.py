@@ -3,9 +3,9 @@
 # See the LICENSE file for details.
 from __future__ import annotations
 
-from typing import Annotated, Any, Iterable, Iterator
+from typing import Annotated, Any, Callable, Iterable, Iterator
 
-from structclasses.base import Context, Field
+from structclasses.base import Context, Field, cache_type_factory
 from structclasses.field.primitive import PrimitiveField
 
 
@@ -26,6 +26,8 @@ class BytesField(PrimitiveField):
             self.length = length
         self.pack_length = None
         self.unpack_length = None
+        # Text is encoded/decoded, while binary data is packed as-is.
+        self.is_text = issubclass(field_type, str)
         if not isinstance(self.length, int):
             kwargs["fmt"] = ""
         super().__init__(field_type, length=self.length, **kwargs)
@@ -39,6 +41,17 @@ class BytesField(PrimitiveField):
         self.unpack_length = unpack_length
         return super().configure(**kwargs)
 
+    def is_static(self) -> bool:
+        # The value is encoded/decoded, so can not be packed as-is.
+        return False
+
+    def static_converters(self) -> tuple[Callable | None, Callable | None] | None:
+        if not isinstance(self.length, int) or self.pack_length or self.unpack_length:
+            return None
+        if self.is_text:
+            return str.encode, _decode_text
+        return None, None
+
     def struct_format(self, context: Context) -> str:
         if isinstance(self.unpack_length, Field):
             # Encode the length value to be packed into the data stream.
@@ -87,10 +100,13 @@ class BytesField(PrimitiveField):
 
     def pack_value(self, context: Context, value: Any) -> Iterable[bytes]:
         assert isinstance(value, self.type)
-        if isinstance(value, str):
+        if self.is_text:
             value = value.encode()
         if isinstance(self.unpack_length, Field):
             length = self.get_length(context, self.pack_length)
+            if self.unpack_length.is_static():
+                # The length prefix is packed as-is, along with the value in the same struct.
+                return (length, value)
             return (*self.unpack_length.pack_value(context, length), value)
         else:
             return (value,)
@@ -98,22 +114,32 @@ class BytesField(PrimitiveField):
     def unpack_value(self, context: Context, values: Iterator[bytes]) -> Any:
         if isinstance(self.unpack_length, Field):
             length = next(values)
-            value = next(context.unpack_next(f"{length}s"))
+            # Read the data directly, rather than compiling a struct format for each length.
+            value = context.unpack_bytes(length)
         else:
             value = next(values)
-        if issubclass(self.type, str):
-            value = value.decode().split("\0", 1)[0]
+        if self.is_text:
+            value = _decode_text(value)
         assert isinstance(value, self.type)
         return value
 
 
+def _decode_text(value: bytes) -> str:
+    # Only decode the text up to the first NUL, not any padding after it.
+    return value.split(b"\0", 1)[0].decode()
+
+
 class text:
+    @classmethod
+    @cache_type_factory
     def __class_getitem__(cls, arg) -> str:
         length = arg
         return Annotated[str, BytesField[str, length]]
 
 
 class binary:
+    @classmethod
+    @cache_type_factory
     def __class_getitem__(cls, arg) -> bytes:
         length = arg
         return Annotated[bytes, BytesField[bytes, length]]
@@ -46,3 +46,11 @@ def test_embedded_textlen_struct() -> None:
     assert "=2B" == S._format()
     assert "=B5sB7s" == s._format()
     assert s == S._unpack(s._pack())
+
+
+def test_text_ignores_data_after_nul() -> None:
+    @structclass
+    class S:
+        a: text[8]
+
+    assert S("abc") == S._unpack(b"abc\0\xff\xfe\0\0")
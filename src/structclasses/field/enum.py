@@ -4,7 +4,7 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import Any, Iterable, Iterator
+from typing import Any, Callable, Iterable, Iterator
 
 from structclasses.base import Context, Field, PrimitiveType
 
@@ -20,10 +20,34 @@ class EnumField(Field):
     def __init__(self, field_type: type[Enum], **kwargs) -> None:
         self.member_type_field = Field._create_field(type(next(iter(field_type)).value))
         super().__init__(field_type, fmt=self.member_type_field.fmt, **kwargs)
+        # Bound up front, as these are called once for each value, e.g. for every array element.
+        self._member_pack_value = self.member_type_field.pack_value
+        self._member_unpack_value = self.member_type_field.unpack_value
+        self._ctor = field_type
+        # The enum's own value to member map, skipping the enum call machinery for known values.
+        self._by_value = field_type._value2member_map_
 
     def pack_value(self, context: Context, value: Any) -> Iterable[PrimitiveType]:
-        assert isinstance(value, self.type)
-        return self.member_type_field.pack_value(context, value.value)
+        assert isinstance(value, self._ctor)
+        return self._member_pack_value(context, value.value)
 
     def unpack_value(self, context: Context, values: Iterator[Any]) -> Any:
-        return self.type(self.member_type_field.unpack_value(context, values))
+        return self.from_value(self._member_unpack_value(context, values))
+
+    def static_converters(self) -> tuple[Callable | None, Callable | None] | None:
+        if not self.member_type_field.is_static():
+            return None
+        return self.to_value, self.from_value
+
+    def to_value(self, member: Enum) -> Any:
+        """Value of enum `member`, which must be a member of this field's enum."""
+        assert isinstance(member, self._ctor)
+        return member.value
+
+    def from_value(self, value: Any) -> Enum:
+        """Enum member for `value`."""
+        try:
+            return self._by_value[value]
+        except KeyError:
+            # Let the enum deal with it, e.g. for flags or enums with `_missing_`.
+            return self._ctor(value)
@@ -34,6 +34,9 @@ class PrimitiveField(Field):
 
         super().__init__(field_type, fmt=fmt, **kwargs)
 
+    def is_static(self) -> bool:
+        return True
+
     def pack_value(self, context: Context, value: Any) -> Iterable[PrimitiveType]:
         assert isinstance(value, self.type)
         return (value,)
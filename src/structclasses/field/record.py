@@ -3,11 +3,15 @@
 # See the LICENSE file for details.
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from contextlib import nullcontext
+from dataclasses import fields as dataclass_fields
+from dataclasses import is_dataclass
+from itertools import islice
+from operator import itemgetter
 from typing import Annotated, Any, Iterable, Iterator
 
-from structclasses.base import Context, Field, PrimitiveType
+from structclasses.base import Context, Field, PrimitiveType, cache_type_factory, lookup
 from structclasses.decorator import fields, is_structclass, params
 
 
@@ -31,9 +35,25 @@ class RecordField(Field):
         if fields is not None:
             self.fields = tuple(fields)
         assert hasattr(self, "fields")
-        self.align = max(fld.align for fld in self.fields)
+        # The alignment of the record may be changed with `field(align=...)`, which does not change
+        # the alignment of its fields.
+        self.fields_align = self.align = max(fld.align for fld in self.fields)
+        self.names = tuple(fld.name for fld in self.fields)
+        # Static fields check that their values are of the field type when packed.
+        self.types = tuple(fld.type for fld in self.fields)
+        # Get the values of all fields from the unpacked record data in one call.
+        get_values = itemgetter(*self.names)
+        self.get_values = get_values if len(self.names) > 1 else lambda data: (get_values(data),)
         self.packed = packed
+        # Records with only static fields are packed/unpacked as a whole, rather than field by field.
+        self.static = all(fld.is_static() for fld in self.fields)
+        self._static_formats: dict[tuple[str, bool, int], tuple[str, int]] = {}
         super().__init__(field_type, **kwargs)
+        # Records taking all fields as positional arguments, in order, may be created without
+        # building a dict of keyword arguments for each record.
+        self.positional = is_dataclass(field_type) and self.names == tuple(
+            fld.name for fld in dataclass_fields(field_type) if fld.init and not fld.kw_only
+        )
 
     @classmethod
     def _create(cls, field_type: type, **kwargs) -> Field:
@@ -57,33 +77,120 @@ class RecordField(Field):
 
     def pack(self, context: Context) -> None:
         """Registers this field to be included in the pack process."""
+        if self.is_static_in(context):
+            self.add_static(context)
+            context.align(self.align)
+            return
         # No value/processing needed for the container itself, besides ensuring
         # proper alignment around the record data.
         # So we don't add self to the context.
         context.align(self.align)
-        with context.scope(self.name, packed=self.packed):
-            for fld in self.fields:
-                fld.pack(context)
+        # Any error aborts the whole pack, so there is no scope to restore in that case.
+        state = context.push_scope(self.name, packed=self.packed)
+        for fld in self.fields:
+            fld.pack(context)
+        context.pop_scope(state)
         context.align(self.align)
 
     def unpack(self, context: Context) -> None:
         """Registers this field to be included in the unpack process."""
+        if self.is_static_in(context):
+            # The padding following the record goes with the record when unpacking, the same as
+            # when registering the fields one by one.
+            self.add_static(context, align_end=not self.packed)
+            return
         context.align(self.align)
         context.get(self.name, default={})
-        with context.scope(self.name, packed=self.packed):
-            for fld in self.fields:
-                fld.unpack(context)
+        # Any error aborts the whole unpack, so there is no scope to restore in that case.
+        state = context.push_scope(self.name, packed=self.packed)
+        for fld in self.fields:
+            fld.unpack(context)
+        context.pop_scope(state)
         # Unpack container last, so we can transform the primitive fields into
         # the container object. This also adds alignment padding as needed.
         context.add(self, struct_format="", align=1 if self.packed else self.align)
 
+    def is_static_in(self, context: Context) -> bool:
+        """Whether all fields are registered at once, using `add_static`."""
+        # With native alignment, struct pads relative to the start of each format rather than the
+        # start of the data, so leave that to the field by field registration.
+        return self.static and context.params.byte_order_char != "@"
+
+    def add_static(self, context: Context, align_end: bool = False) -> None:
+        """Registers all fields of a static record at once, with the same padding as one by one.
+
+        With `align_end`, the padding following the record is included with the record, rather than
+        left for the next field.
+        """
+        context.align(self.align)
+        state = context.push_scope()
+        # The scope, and thereby the packed option, is only changed for named records.
+        if self.name is not None:
+            context.packed = self.packed
+        padding = context.get_padding(self.fields[0].align)
+        start = context.get_offset() + (int(padding[:-1]) if padding else 0)
+        key = (context.params.byte_order_char, context.packed, start % self.fields_align)
+        if (static_format := self._static_formats.get(key)) is None:
+            scratch = context.clone(root={}, data=b"")
+            scratch.offset = key[2]
+            scratch.packed = key[1]
+            for fld in self.fields:
+                fld.pack(scratch)
+            static_format = scratch.struct_format[1:], scratch.size
+            self._static_formats[key] = static_format
+        fmt, size = static_format
+        context.pop_scope(state)
+        # The padding following the record depends on the scope holding the record.
+        if align_end and not context.packed and (pad := (start + size) % self.align) > 0:
+            fmt = f"{fmt}{self.align - pad}x"
+        context.add(self, struct_format=f"{padding}{fmt}", align=1)
+
+    def pack_value(self, context: Context, value: Any) -> Iterable[PrimitiveType]:
+        """Return the values of all fields, for static records."""
+        values = [lookup(value, fld.name) for fld in self.fields]
+        assert all(map(isinstance, values, self.types))
+        return values
+
     def unpack_value(self, context: Context, values: Iterator[PrimitiveType]) -> Any:
-        with context.scope(self.name, packed=self.packed):
-            kwargs = {fld.name: context.get(fld.name) for fld in self.fields}
-        return self.type(**kwargs)
+        if self.is_static_in(context):
+            return self.create_record([fld.unpack_value(context, values) for fld in self.fields])
+        # Look up the unpacked record data once, rather than walking the scope for each field.
+        data = context.get(self.name)
+        if type(data) is dict:
+            return self.create_record(self.get_values(data))
+        state = context.push_scope(self.name, packed=self.packed)
+        field_values = [context.get(name) for name in self.names]
+        context.pop_scope(state)
+        return self.create_record(field_values)
+
+    def create_record(self, field_values: Sequence[Any]) -> Any:
+        """Create record from the values of all fields, in field order."""
+        if self.positional:
+            return self.type(*field_values)
+        return self.type(**dict(zip(self.names, field_values)))
+
+    def unpack_batch(
+        self, context: Context, values: Iterator[PrimitiveType], count: int
+    ) -> list[Any]:
+        """Create `count` records from `values`, holding the values of all fields of each record.
+
+        For records with only static fields, where each field value is unpacked as-is.
+        """
+        names = self.names
+        # Group the values for each record, by zipping the same iterator with itself.
+        rows = zip(*[islice(values, count * len(names))] * len(names))
+        if self.type is dict:
+            # Plain dict records are created right away from the names and values.
+            return [dict(zip(names, row)) for row in rows]
+        create = self.type
+        if self.positional:
+            return [create(*row) for row in rows]
+        return [create(**dict(zip(names, row))) for row in rows]
 
 
 class record:
+    @classmethod
+    @cache_type_factory
     def __class_getitem__(cls, arg: tuple[type[Mapping], tuple[str, type], ...]) -> type[Mapping]:
         container, *field_types = arg
         fields = tuple(
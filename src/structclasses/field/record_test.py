@@ -0,0 +1,164 @@
+# Copyright (c) 2025 Andreas Stenius
+# This software is licensed under the MIT License.
+# See the LICENSE file for details.
+import pytest
+
+from structclasses import (
+    array,
+    double,
+    field,
+    int8,
+    int16,
+    int32,
+    int64,
+    record,
+    structclass,
+    text,
+    uint8,
+    uint16,
+)
+from structclasses.base import Context
+from structclasses.field.record import RecordField
+
+
+@pytest.mark.parametrize(
+    "packed, inner_packed, fmt",
+    [
+        (False, False, "=B3xb3xih2xb7xdBB2sb3xih2xB"),
+        (True, False, "=Bb2xihb5xdBB2sb3xihB"),
+        (True, True, "=Bbihb7xdBB2sbihB"),
+    ],
+)
+def test_static_record_padding(packed: bool, inner_packed: bool, fmt: str) -> None:
+    @structclass(packed=inner_packed)
+    class Inner:
+        a: int8
+        b: int32
+        c: int16
+
+    @structclass(packed=packed)
+    class Outer:
+        head: uint8
+        i: Inner
+        r: record[dict, ("x", int8), ("y", double)]  # noqa: F821
+        n: uint8
+        t: text[5] = field(pack_length="t", unpack_length=uint8)
+        j: Inner
+        tail: uint8
+
+    s = Outer(9, Inner(1, 2, 3), dict(x=4, y=5.0), 6, "ab", Inner(7, 8, 9), 10)
+    assert fmt == s._format()
+    assert s == Outer._unpack(s._pack())
+
+
+def test_static_record_with_lower_alignment() -> None:
+    @structclass
+    class Flat:
+        head: uint8
+        x: int8
+        y: int32
+        tail: uint8
+
+    @structclass
+    class Inner:
+        x: int8
+        y: int32
+
+    @structclass
+    class Outer:
+        head: uint8
+        r: record[dict, ("x", int8), ("y", int32)] = field(align=1)  # noqa: F821
+        tail: uint8
+
+    @structclass
+    class Nested:
+        head: uint8
+        i: Inner = field(align=2)
+        tail: uint8
+
+    # The fields of the record keep their alignment, as with the fields laid out one by one.
+    assert Flat._format() == Outer._format()
+    assert "=B1xb1xiB" == Nested._format()
+    s = Nested(1, Inner(2, 3), 4)
+    assert s == Nested._unpack(s._pack())
+
+
+def test_static_record_in_packed_scope() -> None:
+    @structclass
+    class Inner:
+        a: uint16
+        r: record[dict, ("x", int64), ("y", int8)]  # noqa: F821
+
+    @structclass(packed=True)
+    class Outer:
+        i: Inner
+        j: Inner
+
+    s = Outer(Inner(1, dict(x=2, y=3)), Inner(4, dict(x=5, y=6)))
+    assert "=H6xqb7xH6xqb7x" == Outer._format() == s._format()
+    assert 48 == len(Outer)
+    assert s == Outer._unpack(s._pack())
+
+
+def test_static_record_value_types() -> None:
+    @structclass
+    class Inner:
+        x: double
+        y: int8
+
+    @structclass
+    class Outer:
+        i: Inner
+        r: record[dict, ("x", double), ("y", int8)]  # noqa: F821
+
+    with pytest.raises(AssertionError):
+        Outer(Inner(1, 2), dict(x=1.0, y=2))._pack()
+    with pytest.raises(AssertionError):
+        Outer(Inner(1.0, 2), dict(x=1, y=2))._pack()
+
+
+def test_record_field_class_is_reused() -> None:
+    ab = record[dict, ("a", int8), ("b", int32)]
+    assert ab is record[dict, ("a", int8), ("b", int32)]
+    assert ab is not record[dict, ("a", int8)]
+
+
+def test_record_type_from_unhashable_fields() -> None:
+    @structclass
+    class Lists:
+        r: record[dict, ["x", int8], ["y", int32]]  # noqa: F821
+
+    s = Lists(dict(x=1, y=2))
+    assert "=b3xi" == s._format()
+    assert s == Lists._unpack(s._pack())
+
+
+def test_unpack_batch() -> None:
+    @structclass
+    class Point:
+        x: int8
+        y: int8
+
+    fld = RecordField._create(Point)
+    assert fld.positional
+    assert [Point(1, 2), Point(3, 4)] == fld.unpack_batch(Context(), iter((1, 2, 3, 4, 5)), 2)
+
+    fld = record[dict, ("x", int8), ("y", int8)].__metadata__[0](dict)
+    assert [{"x": 1, "y": 2}] == fld.unpack_batch(Context(), iter((1, 2)), 1)
+
+
+def test_static_record_after_dynamic_field() -> None:
+    @structclass
+    class Inner:
+        a: int8
+        b: int32
+
+    @structclass
+    class Outer:
+        n: uint8
+        xs: array[uint8, "n"]  # noqa: F821
+        i: Inner
+
+    o = Outer(2, [1, 2], Inner(3, 4))
+    assert b"\2\1\2\0\3\0\0\0\4\0\0\0" == o._pack()
+    assert o == Outer._unpack(o._pack())
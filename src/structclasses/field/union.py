@@ -3,11 +3,10 @@
 # See the LICENSE file for details.
 from __future__ import annotations
 
-import struct
 from collections.abc import Callable, Mapping
 from typing import Annotated, Any, Iterable, Iterator, Union
 
-from structclasses.base import Context, Field
+from structclasses.base import Context, Field, _struct, cache_type_factory
 from structclasses.field.primitive import PrimitiveType
 
 
@@ -41,7 +40,8 @@ class UnionField(Field):
     """
 
     def __class_getitem__(cls, fields: Mapping[str, Field]) -> type[UnionField]:
-        ns = dict(fields=fields)
+        # The layout only depends on the fields, so it is shared by all instances of the class.
+        ns = dict(fields=fields, **cls._layout(fields))
         return cls._create_specialized_class(f"{cls.__name__}__{len(fields)}", ns, unique=True)
 
     def __init__(
@@ -52,16 +52,27 @@ class UnionField(Field):
     ) -> None:
         if fields is not None:
             self.fields = fields
-        assert isinstance(self.fields, Mapping)
-        self.align = max(fld.align for fld in self.fields.values())
+            self.__dict__.update(self._layout(fields))
         self.pack_length = None
         self.unpack_length = None
         self.selector = None
         self.field_selector_map = None
-        size = max(fld.size() for fld in self.fields.values())
-        self.fmt = f"{size}s"
+        self.field_names_by_selector = None
+        self.length_key = None
+        self.multi_selector = False
         super().__init__(Union, **kwargs)
 
+    @staticmethod
+    def _layout(fields: Mapping[str, Field]) -> dict[str, Any]:
+        """Alignment, format and fields by name for a union of `fields`."""
+        assert isinstance(fields, Mapping)
+        size = max(fld.size() for fld in fields.values())
+        return dict(
+            align=max(fld.align for fld in fields.values()),
+            fmt=f"{size}s",
+            fields_by_name={fld.name: fld for fld in fields.values()},
+        )
+
     def _register(
         self, name: str, fields: dict[str, Field], field_meta: dict[str, dict], cls: type, **kwargs
     ) -> None:
@@ -90,16 +101,26 @@ class UnionField(Field):
             self.selector = selector
         if field_selector_map is not None:
             self.field_selector_map = field_selector_map
+            try:
+                # Reverse map, keeping the first field for any duplicate selector values.
+                self.field_names_by_selector = {
+                    value: field_name
+                    for field_name, value in reversed(tuple(field_selector_map.items()))
+                }
+            except TypeError:
+                # Unhashable selector values, look them up one by one instead.
+                self.field_names_by_selector = None
+        # Decided once here, rather than on every pack and unpack.
+        self.length_key = self.unpack_length if isinstance(self.unpack_length, str) else None
+        self.multi_selector = isinstance(self.selector, (tuple, list))
         return super().configure(**kwargs)
 
     def select(self, fld: Field, context: Context) -> None:
         if self.selector is None:
             return
         if self.field_selector_map:
-            for field_name, value in self.field_selector_map.items():
-                if field_name == fld.name:
-                    selected = value
-                    break
+            if fld.name in self.field_selector_map:
+                selected = self.field_selector_map[fld.name]
             else:
                 raise UnionFieldSelectorMapError(
                     f"union field {fld.name!r} is missing in field selector map"
@@ -113,27 +134,38 @@ class UnionField(Field):
         if self.selector is not None:
             selected = context.get(self.selector)
             if self.field_selector_map:
-                for field_name, value in self.field_selector_map.items():
-                    if value == selected:
-                        selected = field_name
-                        break
-                else:
-                    raise UnionFieldSelectorMapError(
-                        f"union selector value {selected!r} is missing in field selector map"
-                    )
+                selected = self.get_field_name(selected)
             elif not isinstance(selected, str):
                 raise UnionFieldSelectorMapError(
                     f"union selector value {selected!r} must be translated to a union field name using a  field selector map"
                 )
-        for fld in self.fields.values():
-            if selected is None or selected == fld.name:
-                return fld
+        if selected is None and self.fields:
+            return next(iter(self.fields.values()))
+        if (fld := self.fields_by_name.get(selected)) is not None:
+            return fld
         raise UnionFieldError(f"unknown union member field: {selected!r}")
 
+    def get_field_name(self, selected: Any) -> str:
+        """Translate selector value to union field name, using the field selector map."""
+        if self.field_names_by_selector is not None:
+            try:
+                return self.field_names_by_selector[selected]
+            except (KeyError, TypeError):
+                pass
+        else:
+            for field_name, value in self.field_selector_map.items():
+                if value == selected:
+                    return field_name
+        raise UnionFieldSelectorMapError(
+            f"union selector value {selected!r} is missing in field selector map"
+        )
+
     def selected_size(self, context: Context) -> int:
         fld = self.selected(context)
-        with context.scope(self.name):
-            return fld.size(context)
+        state = context.push_scope(self.name)
+        size = fld.size(context)
+        context.pop_scope(state)
+        return size
 
     def struct_format(self, context: Context) -> str:
         # Unpack length is always correct at this point, also when packing.
@@ -155,27 +187,27 @@ class UnionField(Field):
 
     def pack(self, context: Context) -> None:
         """Registers this field to be included in the pack process."""
-        if isinstance(self.unpack_length, str):
+        if self.length_key is not None:
             # Update unpack length field when packing.
-            context.set(self.unpack_length, self.get_length(context, self.pack_length))
+            context.set(self.length_key, self.get_length(context, self.pack_length))
         context.add(self)
 
     def unpack(self, context: Context) -> None:
         """Registers this field to be included in the unpack process."""
-        if self.selector is not None or isinstance(self.unpack_length, str):
+        if self.selector is not None or self.length_key is not None:
             if context.data:
                 context.unpack()
 
             size = None
-            if isinstance(self.unpack_length, str):
-                size = context.get(self.unpack_length, default=None)
+            if self.length_key is not None:
+                size = context.get(self.length_key, default=None)
 
             if size is None and (
                 self.selector is None
                 or (vs := context.get(self.selector, default=None)) is None
                 or (
-                    isinstance(vs, tuple)
-                    and isinstance(self.selector, (tuple, list))
+                    self.multi_selector
+                    and isinstance(vs, tuple)
                     and len(vs) == len(self.selector)
                     and all(v is None for v in vs)
                 )
@@ -202,6 +234,8 @@ class UnionField(Field):
 
 
 class union:
+    @classmethod
+    @cache_type_factory
     def __class_getitem__(cls, arg: tuple[tuple[str, type], ...]) -> UnionProperty:
         fields = {name: Field._create_field(elem_type, name=name) for name, elem_type in arg}
         # This works in py2.12, but not in py2.10... :/
@@ -274,7 +308,9 @@ class UnionPropertyValue:
         if name.startswith("__"):
             return object.__getattribute__(self, name)
 
-        if self.__kind__ not in (name, None):
+        # The active kind is looked up through the selector, so only do that once.
+        kind = self.__kind__
+        if kind not in (name, None):
             raise UnionValueNotActiveError(name)
 
         fld = self.__union.fields.get(name)
@@ -282,7 +318,7 @@ class UnionPropertyValue:
             raise AttributeError(name)
 
         if name not in self.__values:
-            if self.__selected != self.__kind__:
+            if self.__selected != kind:
                 # Reset data if kind changes, to avoid parsing data from unrelated types.
                 self.__data__ = b"\0" * fld.size()
             elif not self.__data__:
@@ -305,7 +341,7 @@ class UnionPropertyValue:
                 size = self.__union.size(self.__context)
             else:
                 size = fld.size(ctx)
-            self.__data__ = struct.pack(f"{size}s", ctx.pack())
+            self.__data__ = _struct(f"{size}s").pack(ctx.pack())
         else:
             super().__setattr__(name, value)
 
@@ -314,12 +350,10 @@ class UnionProperty:
     def __init__(self, union_field: UnionField):
         self.union = union_field
 
-    @property
-    def value_attr(self) -> str:
-        return f"__union_{self.name}_value"
-
     def __set_name__(self, owner, name) -> None:
         self.name = name
+        # Attribute for the union value on each instance, looked up on every access.
+        self.value_attr = f"__union_{name}_value"
 
     def __get__(self, obj, objtype=None) -> UnionPropertyValue:
         if obj is None:
@@ -1,8 +1,11 @@
 # Copyright (c) 2025 Andreas Stenius
 # This software is licensed under the MIT License.
 # See the LICENSE file for details.
+from copy import copy
+
 import pytest
 
+from structclasses.base import Context
 from structclasses.decorator import fields, structclass
 from structclasses.field.data import text
 from structclasses.field.meta import field
@@ -213,6 +216,13 @@ def test_packed_records(pack_data, pack_union, data_fmt, union_fmt, union_len) -
     assert union_len == len(pu)
 
 
+def test_union_without_fields() -> None:
+    fld = copy(fields(StdCUnionClass)[0])
+    fld.fields = fld.fields_by_name = {}
+    with pytest.raises(UnionFieldError):
+        fld.selected(Context())
+
+
 def test_empty_union() -> None:
     @structclass
     class U:
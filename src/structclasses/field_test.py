@@ -55,6 +55,7 @@ class MyEnum(IntEnum):
         (list[uint16], array[uint16, 5], 2, "=5H", [12, 23, 34, 45, 56]),
         (list[text[3]], array[text[3], 3], 1, "=3s3s3s", ["a", "bc", "def"]),
         (MyEnum, MyEnum, 4, "=i", MyEnum.B),
+        (list[MyEnum], array[MyEnum, 3], 4, "=3i", [MyEnum.B, MyEnum.A, MyEnum.B]),
     ],
 )
 def test_create_field(